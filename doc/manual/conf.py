@@ -31,18 +31,10 @@ needs_sphinx = '2.0'
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
 extensions = [
-    'sphinx.ext.autodoc',
     'sphinx.ext.intersphinx',
     'sphinx_rtd_theme'
 ]
 
-autodoc_default_options = {
-    'members': True,
-    'imported-members': True
-}
-
-autodoc_inherit_docstrings = False
-
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
 
@@ -219,32 +211,35 @@ html_show_sphinx = False
 # This is the file name suffix for HTML files (e.g. ".xhtml").
 html_file_suffix = ".html"
 
-# Configure optional spelling extension if present.
+# Configure optional spelling extension if present and the spelling builder has been selected
+# (either with '-b spelling' on the sphinx-build command line or by setting OVITO_DOCS_SPELLING=1).
+# This avoids loading the enchant library during regular HTML builds.
 # See https://sphinxcontrib-spelling.readthedocs.io/en/latest/
-try:
-    import enchant
-    import importlib.util
-    if importlib.util.find_spec("sphinxcontrib.spelling"):
-        extensions.append('sphinxcontrib.spelling')
-
-        # String specifying the language, as understood by PyEnchant and enchant.
-        #spelling_lang='en_US'
-
-        # String specifying a file containing a list of words known to be spelled correctly but that do not appear in the language 
-        # dictionary selected by 'spelling_lang'. The file should contain one word per line. 
-        #spelling_word_list_filename='spelling_wordlist.txt'
-
-        # Boolean controlling whether suggestions for misspelled words are printed.    
-        #spelling_show_suggestions = False
-
-        # Boolean controlling whether the contents of the line containing each misspelled word is printed, for more context about the location of each word.
-        #spelling_show_whole_line = True
-
-        # Boolean controlling whether a misspelling is emitted as a sphinx warning or as an info message.
-        spelling_warning = True
-
-        # A list of glob-style patterns that should be ignored when checking spelling. They are matched against the 
-        # source file names relative to the source directory, using slashes as directory separators on all platforms.
-        spelling_exclude_patterns=['licenses/*']
-except:
-    pass
+if os.getenv("OVITO_DOCS_SPELLING") == "1" or "spelling" in sys.argv:
+    try:
+        import enchant
+        import importlib.util
+        if importlib.util.find_spec("sphinxcontrib.spelling"):
+            extensions.append('sphinxcontrib.spelling')
+
+            # String specifying the language, as understood by PyEnchant and enchant.
+            #spelling_lang='en_US'
+
+            # String specifying a file containing a list of words known to be spelled correctly but that do not appear in the language 
+            # dictionary selected by 'spelling_lang'. The file should contain one word per line. 
+            #spelling_word_list_filename='spelling_wordlist.txt'
+
+            # Boolean controlling whether suggestions for misspelled words are printed.    
+            #spelling_show_suggestions = False
+
+            # Boolean controlling whether the contents of the line containing each misspelled word is printed, for more context about the location of each word.
+            #spelling_show_whole_line = True
+
+            # Boolean controlling whether a misspelling is emitted as a sphinx warning or as an info message.
+            spelling_warning = True
+
+            # A list of glob-style patterns that should be ignored when checking spelling. They are matched against the 
+            # source file names relative to the source directory, using slashes as directory separators on all platforms.
+            spelling_exclude_patterns=['licenses/*']
+    except ImportError:
+        pass